@@ -8,57 +8,99 @@ Commands:
 - list: show stored entry names
 - rm <name>: delete an entry
 - store: open the storage directory in your editor/file manager
+- watch: keep the listing index up to date in the background (Linux)
 """
 
 from __future__ import annotations
 
-import argparse
-import io
+import errno
+import functools
 import os
-import shutil
-import subprocess
+import re
+import stat
+import struct
 import sys
+import time
 from pathlib import Path
-from typing import Callable, Iterable, Optional
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
 
-# Reconfigure stdout to handle Unicode on Windows
-if sys.platform == "win32":
-    # Try to set UTF-8 encoding for stdout
-    if hasattr(sys.stdout, "reconfigure"):
-        try:
-            sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-        except (AttributeError, LookupError):
-            pass
-    # Fallback: wrap stdout with a UTF-8 encoder
-    if hasattr(sys.stdout, "buffer"):
-        sys.stdout = io.TextIOWrapper(
-            sys.stdout.buffer,
-            encoding="utf-8",
-            errors="replace",
-            newline=None,
-            write_through=True,
-        )
+# Platform checks, evaluated once at import
+_IS_WIN = sys.platform.startswith("win")
+_IS_MAC = sys.platform == "darwin"
+_IS_LINUX = sys.platform.startswith("linux")
 
 # Prohibited filenames that should not be saved (e.g., hard‑coded command files)
 # Check by filename prefix, not extension
-PROHIBITED_PREFIXES = {"list", "rm", "add", "store", "save"}
+PROHIBITED_PREFIXES = frozenset({"list", "rm", "add", "store", "save", "watch"})
+
+# Extensions picked up by folder imports, as a tuple for str.endswith
+ELIGIBLE_SUFFIXES = (".md", ".txt")
+
+# Folders never descended into when discovering files to import
+SKIPPED_DIRS = frozenset({"node_modules", "__pycache__"})
 
 STORAGE_ENV = "PROMPT_PASTE_STORAGE"
 
+# Hidden subcommand used by the shell completion scripts in scripts/
+COMPLETE_COMMAND = "__complete"
+
+# FICLONE ioctl request (_IOW(0x94, 9, int)) for reflink copies on Linux
+_FICLONE = 0x40049409
+_CLONE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS}
+)
+
+# Windows and macOS volumes are usually case-insensitive, so name collisions
+# are compared case-folded there
+_CASE_INSENSITIVE_FS = _IS_WIN or _IS_MAC
+
+# Listing index kept inside the storage folder between runs. The index folder
+# itself is never listed; other dotfiles (.cursorrules, ...) are entries.
+INDEX_DIR = ".index"
+INDEX_FILE = "listing.json"
+INDEX_VERSION = 2
+# Cached records are only trusted once they were scanned this long after the
+# mtime they saw. Coarse timestamps (FAT, HFS+, NFS) can otherwise hide an edit
+# made in the same tick as the scan; this is git's "racily clean" rule.
+INDEX_RACY_NS = 2_000_000_000
+
 
 def get_storage_dir() -> Path:
     """Determine where snippets are kept, overrideable by PROMPT_PASTE_STORAGE."""
-    override = os.environ.get(STORAGE_ENV)
+    return _storage_dir_for(os.environ.get(STORAGE_ENV))
+
+
+@functools.lru_cache(maxsize=1)
+def _storage_dir_for(override: Optional[str]) -> Path:
+    """Build the storage path once per distinct PROMPT_PASTE_STORAGE value."""
     return Path(override) if override else Path.home() / ".prompt_paste"
 
 
+# Storage folder already created by ensure_storage_dir in this process
+_STORAGE_READY: Optional[Path] = None
+
+
 def ensure_storage_dir() -> Path:
     """Ensure the storage folder exists and return its path."""
+    global _STORAGE_READY
     directory = get_storage_dir()
-    directory.mkdir(parents=True, exist_ok=True)
+    if directory is not _STORAGE_READY:
+        directory.mkdir(parents=True, exist_ok=True)
+        _STORAGE_READY = directory
     return directory
 
 
+def _reset_cache() -> None:
+    """Forget memoized storage lookups (used by tests that swap storage)."""
+    global _STORAGE_READY
+    _storage_dir_for.cache_clear()
+    _STORAGE_READY = None
+
+
+# Runs of slashes collapse to one separator in entry paths
+_SLASH_RE = re.compile(r"/+")
+
+
 def normalize_path(path_str: str) -> str:
     """Normalize path string by removing trailing slashes and empty segments.
 
@@ -74,11 +116,8 @@ def normalize_path(path_str: str) -> str:
         >>> normalize_path('bucket//prompt1')
         'bucket/prompt1'
     """
-    # Strip leading and trailing slashes
-    cleaned = path_str.strip("/")
-    # Remove empty segments from double slashes
-    segments = [seg for seg in cleaned.split("/") if seg]
-    return "/".join(segments)
+    # Collapse runs of slashes, then strip leading and trailing ones
+    return _SLASH_RE.sub("/", path_str).strip("/")
 
 
 def resolve_path(path_str: str, storage: Path) -> Path:
@@ -98,11 +137,8 @@ def resolve_path(path_str: str, storage: Path) -> Path:
         Path('/storage/prompt1.md')
     """
     normalized = normalize_path(path_str)
-    segments = normalized.split("/")
-    result = storage
-
-    for segment in segments:
-        result = result / segment
+    # Join all segments in one call instead of building a Path per segment
+    result = storage.joinpath(*normalized.split("/"))
 
     # Add .md extension if no extension present
     if not result.suffix:
@@ -111,6 +147,41 @@ def resolve_path(path_str: str, storage: Path) -> Path:
     return result
 
 
+def _exists(path: Path) -> bool:
+    """Return whether path exists, using a single stat() call."""
+    try:
+        os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return True
+
+
+def _classify(path: Path) -> str:
+    """Return "dir", "file" or "missing" for path, using one stat() call."""
+    try:
+        mode = os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return "missing"
+    return "dir" if stat.S_ISDIR(mode) else "file"
+
+
+def _require_dir(path: Path) -> None:
+    """Raise FileNotFoundError or NotADirectoryError unless path is a folder."""
+    kind = _classify(path)
+    if kind == "missing":
+        raise FileNotFoundError(str(path))
+    if kind != "dir":
+        raise NotADirectoryError(str(path))
+
+
+def _is_file(path: Path) -> bool:
+    """Return whether path is an existing regular file, using one stat() call."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
 def get_entry_by_path(path_str: str, storage: Path) -> Path:
     """Find an entry by hierarchical path, supporting partial matches.
 
@@ -132,18 +203,24 @@ def get_entry_by_path(path_str: str, storage: Path) -> Path:
     """
     resolved = resolve_path(path_str, storage)
 
-    if resolved.exists() and resolved.is_file():
+    if _is_file(resolved):
         return resolved
 
     # Try without extension if not found
     if resolved.suffix:
         resolved_no_ext = resolved.with_suffix("")
-        if resolved_no_ext.exists() and resolved_no_ext.is_file():
+        if _is_file(resolved_no_ext):
             return resolved_no_ext
 
     raise FileNotFoundError(f"Entry '{path_str}' not found in storage")
 
 
+def _stem(name: str) -> str:
+    """Return a file name's stem like PurePath.stem, without building a path."""
+    dot = name.rfind(".")
+    return name[:dot] if dot > 0 else name
+
+
 def is_eligible_file(file_path: Path) -> bool:
     """Check if a file is eligible for import (.md or .txt).
 
@@ -159,7 +236,7 @@ def is_eligible_file(file_path: Path) -> bool:
         >>> is_eligible_file(Path('file.py'))
         False
     """
-    return file_path.suffix.lower() in {".md", ".txt"}
+    return file_path.name.lower().endswith(ELIGIBLE_SUFFIXES)
 
 
 def is_single_skill_folder(folder: Path) -> bool:
@@ -177,16 +254,27 @@ def is_single_skill_folder(folder: Path) -> bool:
         >>> is_single_skill_folder(Path('/my-skill'))  # with SKILL.md + other files
         False
     """
-    if not folder.is_dir():
+    found = None
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                # DirEntry.is_file() answers from d_type except for symlinks
+                if not entry.is_file():
+                    continue
+                if found is not None:
+                    return False
+                found = entry.name
+    except (FileNotFoundError, NotADirectoryError):
         return False
-
-    files = [f for f in folder.iterdir() if f.is_file()]
-    return len(files) == 1 and files[0].name == "SKILL.md"
+    return found == "SKILL.md"
 
 
 def discover_folder_files(folder: Path) -> list[Path]:
     """Find all .md and .txt files in a folder (recursive).
 
+    Hidden folders and SKIPPED_DIRS (node_modules, __pycache__) are not
+    descended into.
+
     Args:
         folder: Path to the folder to scan
 
@@ -201,22 +289,42 @@ def discover_folder_files(folder: Path) -> list[Path]:
         >>> discover_folder_files(Path('/myfolder'))
         [Path('file1.md'), Path('file2.txt'), Path('subfolder/file3.md')]
     """
-    if not folder.exists():
-        raise FileNotFoundError(str(folder))
-    if not folder.is_dir():
-        raise NotADirectoryError(str(folder))
+    _require_dir(folder)
 
     eligible_files = []
+    top = str(folder)
+    # Relative folder prefixes still to scan; one scandir() per folder
+    pending = [""]
 
-    for item in folder.rglob("*"):
-        if item.is_file() and is_eligible_file(item):
-            # Skip prohibited filenames
-            if item.stem not in PROHIBITED_PREFIXES:
-                # Get relative path from folder
-                relative_path = item.relative_to(folder)
-                eligible_files.append(relative_path)
-
-    return sorted(eligible_files)
+    while pending:
+        rel_root = pending.pop()
+        try:
+            with os.scandir(os.path.join(top, rel_root)) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir():
+                        # Like os.walk: skip symlinked folders, prune hidden
+                        # and tooling folders
+                        if not (
+                            entry.is_symlink()
+                            or name.startswith(".")
+                            or name in SKIPPED_DIRS
+                        ):
+                            pending.append(os.path.join(rel_root, name))
+                    # is_file() drops dangling symlinks, sockets and FIFOs;
+                    # then skip ineligible types and prohibited filenames
+                    elif (
+                        entry.is_file()
+                        and name.lower().endswith(ELIGIBLE_SUFFIXES)
+                        and _stem(name) not in PROHIBITED_PREFIXES
+                    ):
+                        eligible_files.append(os.path.join(rel_root, name))
+        except OSError:
+            # Unreadable subfolders are skipped, as os.walk does
+            if not rel_root:
+                raise
+
+    return sorted(map(Path, eligible_files))
 
 
 def get_folder_structure(folder: Path) -> dict:
@@ -232,21 +340,22 @@ def get_folder_structure(folder: Path) -> dict:
         >>> get_folder_structure(Path('/myfolder'))
         {'files': [Path('file1.md'), Path('file2.txt')], 'folders': [Path('subfolder')]}
     """
-    if not folder.exists():
-        raise FileNotFoundError(str(folder))
-    if not folder.is_dir():
-        raise NotADirectoryError(str(folder))
+    _require_dir(folder)
 
     files = []
     folders = []
 
-    for item in folder.iterdir():
-        if item.is_file():
-            files.append(item.name)
-        elif item.is_dir():
-            folders.append(item.name)
+    # DirEntry answers is_file/is_dir from d_type; only symlinks cost a stat
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_file():
+                files.append(entry.name)
+            elif entry.is_dir():
+                folders.append(entry.name)
 
-    return {"files": sorted(files), "folders": sorted(folders)}
+    files.sort()
+    folders.sort()
+    return {"files": files, "folders": folders}
 
 
 def confirm_folder_import(
@@ -271,6 +380,87 @@ def confirm_folder_import(
     return response == "y"
 
 
+# Devices (st_dev of the source) where a clone attempt already failed
+_NO_CLONE_DEVICES: set[int] = set()
+
+
+def _clone_file(src: Path, dst: Path, device: int) -> bool:
+    """Try a copy-on-write clone of src into a new dst. Returns False if unsupported.
+
+    The clone is built in a hidden sibling and renamed to dst only once it
+    succeeded, so a failed attempt leaves no empty file behind.
+    """
+    if device in _NO_CLONE_DEVICES or not (_IS_LINUX or _IS_MAC):
+        return False
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.clone")
+    try:
+        if _IS_LINUX:
+            import fcntl
+
+            try:
+                with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError as exc:
+                if exc.errno not in _CLONE_UNSUPPORTED:
+                    raise
+                cloned = False
+            else:
+                cloned = True
+        else:
+            # clonefile() copies metadata too, but refuses to replace an
+            # existing path, hence the temporary sibling
+            cloned = _libc().clonefile(os.fsencode(src), os.fsencode(tmp), 0) == 0
+        if cloned:
+            os.replace(tmp, dst)
+            return True
+    except BaseException:
+        _unlink_quietly(tmp)
+        raise
+    _unlink_quietly(tmp)
+    _NO_CLONE_DEVICES.add(device)
+    return False
+
+
+def _unlink_quietly(path: Path) -> None:
+    """Remove path if it exists, ignoring errors."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _libc():
+    """Load the macOS C library once for clonefile()."""
+    import ctypes
+
+    return ctypes.CDLL("libc.dylib", use_errno=True)
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy src to dst, cloning blocks instead of bytes on Btrfs/XFS/APFS.
+
+    Only contents are copied: saved entries get a fresh mtime, which is also
+    what the listing index keys previews on. An existing dst is always written
+    through, so symlinks, hardlinks and its mode survive an overwrite.
+    """
+    import shutil
+
+    src_st = os.stat(src)
+    try:
+        dst_st = os.stat(dst)
+    except (FileNotFoundError, NotADirectoryError):
+        new = not os.path.islink(dst)
+    else:
+        # Refuse before touching dst, like copy2/copyfile do
+        if (src_st.st_dev, src_st.st_ino) == (dst_st.st_dev, dst_st.st_ino):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        new = False
+    if not (new and _clone_file(src, dst, src_st.st_dev)):
+        # copyfile skips copystat and uses sendfile()/fcopyfile() in-kernel
+        shutil.copyfile(src, dst)
+
+
 def copy_file_with_collision_handling(
     source: Path,
     dest: Path,
@@ -285,7 +475,7 @@ def copy_file_with_collision_handling(
         source: Source file path
         dest: Destination file path
         prompt_fn: Function to prompt the user
-        auto_rename: Automatically rename with _2 suffix if collision
+        auto_rename: Automatically rename with the first free _N suffix if collision
         overwrite: Overwrite existing file without prompting
 
     Returns:
@@ -299,10 +489,14 @@ def copy_file_with_collision_handling(
     )
     if final is None:
         return None
-    shutil.copy2(source, final)
+    _fast_copy(source, final)
     return final
 
 
+# Folder imports with more files than this copy them on a thread pool
+COPY_POOL_THRESHOLD = 8
+
+
 def import_folder(
     source: Path,
     storage: Path,
@@ -317,7 +511,7 @@ def import_folder(
         source: Path to the folder to import
         storage: Base storage directory
         prompt_fn: Function to prompt the user (default: input)
-        auto_rename: Automatically rename with _2 suffix if collision
+        auto_rename: Automatically rename with the first free _N suffix if collision
         overwrite: Overwrite existing file without prompting
 
     Returns:
@@ -331,10 +525,7 @@ def import_folder(
         >>> import_folder(Path('/myfolder'), Path('/storage'), input)
         {'file1.md': Path('/storage/myfolder/file1.md'), 'file2.txt': Path('/storage/myfolder/file2.txt')}
     """
-    if not source.exists():
-        raise FileNotFoundError(str(source))
-    if not source.is_dir():
-        raise NotADirectoryError(str(source))
+    _require_dir(source)
 
     # Discover eligible files
     files = discover_folder_files(source)
@@ -352,28 +543,43 @@ def import_folder(
     dest_folder = storage / source.name
     dest_folder.mkdir(parents=True, exist_ok=True)
 
-    # Copy files
-    imported = {}
+    # Pick every destination on this thread so prompts stay interactive; each
+    # folder is scanned once and names claimed by earlier files are added
+    names: dict[Path, set[str]] = {}
+    plan = []
     for relative_path in files:
-        source_file = source / relative_path
         dest_file = dest_folder / relative_path
-
-        # Create parent directories if needed
-        dest_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Copy with collision handling
-        final_dest = copy_file_with_collision_handling(
-            source_file,
+        parent = dest_file.parent
+        existing = names.get(parent)
+        if existing is None:
+            # Create parent directories if needed
+            parent.mkdir(parents=True, exist_ok=True)
+            existing = names[parent] = _scan_names(parent)
+
+        final_dest = resolve_destination(
             dest_file,
             prompt_fn,
             auto_rename=auto_rename,
             overwrite=overwrite,
+            existing=existing,
         )
-
         if final_dest:
-            imported[str(relative_path)] = final_dest
+            existing.add(_name_key(final_dest.name))
+            plan.append((str(relative_path), source / relative_path, final_dest))
 
-    return imported
+    # Copies are independent, so overlap their syscall latency in a pool
+    if len(plan) > COPY_POOL_THRESHOLD:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _, sources, targets = zip(*plan)
+        workers = min(32, (os.cpu_count() or 1) * 4, len(plan))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_fast_copy, sources, targets))
+    else:
+        for _, source_file, final_dest in plan:
+            _fast_copy(source_file, final_dest)
+
+    return {relative: final_dest for relative, _, final_dest in plan}
 
 
 def detect_conflicts(source: Path, target: Path) -> list[Path]:
@@ -390,15 +596,25 @@ def detect_conflicts(source: Path, target: Path) -> list[Path]:
         >>> detect_conflicts(Path('/source'), Path('/target'))
         [Path('file1.md'), Path('subfolder/file2.md')]
     """
-    conflicts = []
-    source_files = discover_folder_files(source)
+    return detect_conflicts_from_list(discover_folder_files(source), target)
 
-    for relative_path in source_files:
-        target_file = target / relative_path
-        if target_file.exists():
-            conflicts.append(relative_path)
 
-    return conflicts
+def detect_conflicts_from_list(files: list[Path], target: Path) -> list[Path]:
+    """Detect which already-discovered relative paths also exist in target.
+
+    Args:
+        files: Relative file paths, as returned by discover_folder_files
+        target: Target folder
+
+    Returns:
+        List of relative paths to conflicting files
+    """
+    return [relative_path for relative_path in files if _exists(target / relative_path)]
+
+
+# Marker written between prepended source content and the existing entry
+MERGE_SEPARATOR = b"\n\n--- MERGED ---\n\n"
+MERGE_CHUNK_SIZE = 1 << 20
 
 
 def resolve_conflict_with_prepend(source: Path, target: Path) -> None:
@@ -412,14 +628,24 @@ def resolve_conflict_with_prepend(source: Path, target: Path) -> None:
         >>> resolve_conflict_with_prepend(Path('/source/file.md'), Path('/target/file.md'))
         # Target file now has source content prepended
     """
-    source_content = source.read_text(encoding="utf-8", errors="ignore")
-    target_content = target.read_text(encoding="utf-8", errors="ignore")
+    import shutil
 
-    # Add separator between contents
-    separator = "\n\n--- MERGED ---\n\n"
-    merged_content = source_content + separator + target_content
-
-    target.write_text(merged_content, encoding="utf-8")
+    # Stream bytes into a hidden sibling, then swap it in atomically
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as out:
+            with open(source, "rb") as src:
+                shutil.copyfileobj(src, out, MERGE_CHUNK_SIZE)
+            out.write(MERGE_SEPARATOR)
+            with open(target, "rb") as old:
+                shutil.copyfileobj(old, out, MERGE_CHUNK_SIZE)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 
 def confirm_merge(target: Path, prompt_fn: Callable[[str], str]) -> bool:
@@ -464,17 +690,13 @@ def merge_folders(
         >>> merge_folders(Path('/source'), Path('/target'), input)
         {'merged': ['file1.md'], 'conflicts': ['file2.md'], 'skipped': []}
     """
-    if not source.exists():
-        raise FileNotFoundError(str(source))
-    if not target.exists():
-        raise FileNotFoundError(str(target))
-    if not source.is_dir():
-        raise NotADirectoryError(str(source))
-    if not target.is_dir():
-        raise NotADirectoryError(str(target))
+    _require_dir(source)
+    _require_dir(target)
 
-    # Detect conflicts
-    conflicts = detect_conflicts(source, target)
+    # Discover once and reuse the listing for conflicts and copying; the
+    # source and target trees are assumed stable for the duration of the merge
+    source_files = discover_folder_files(source)
+    conflicts = set(detect_conflicts_from_list(source_files, target))
 
     # Confirm merge
     if not confirm_merge(target, prompt_fn):
@@ -486,8 +708,6 @@ def merge_folders(
     resolved_conflicts = []
     skipped = []
 
-    source_files = discover_folder_files(source)
-
     for relative_path in source_files:
         source_file = source / relative_path
         target_file = target / relative_path
@@ -495,13 +715,13 @@ def merge_folders(
         # Create parent directories if needed
         target_file.parent.mkdir(parents=True, exist_ok=True)
 
-        if target_file.exists():
+        if relative_path in conflicts:
             # Resolve conflict with prepend
             resolve_conflict_with_prepend(source_file, target_file)
             resolved_conflicts.append(str(relative_path))
         else:
             # Copy file
-            shutil.copy2(source_file, target_file)
+            _fast_copy(source_file, target_file)
             merged.append(str(relative_path))
 
     return {
@@ -511,6 +731,37 @@ def merge_folders(
     }
 
 
+def _name_key(name: str) -> str:
+    """Normalize a file name for collision checks on case-insensitive platforms."""
+    return name.casefold() if _CASE_INSENSITIVE_FS else name
+
+
+def _scan_names(directory: Path) -> set[str]:
+    """Return the names in a folder from one scandir pass (empty if missing)."""
+    try:
+        with os.scandir(directory) as it:
+            return {_name_key(entry.name) for entry in it}
+    except FileNotFoundError:
+        return set()
+
+
+def _taken(path: Path, existing: Optional[set[str]]) -> bool:
+    """Check a destination against a name snapshot, or stat() it without one."""
+    if existing is None:
+        return _exists(path)
+    return _name_key(path.name) in existing
+
+
+def _free_name(path: Path, existing: Optional[set[str]]) -> Path:
+    """Return the first free `{stem}_N{suffix}` sibling of path, starting at 2."""
+    number = 2
+    while True:
+        candidate = path.parent / f"{path.stem}_{number}{path.suffix}"
+        if not _taken(candidate, existing):
+            return candidate
+        number += 1
+
+
 def resolve_destination(
     target: Path,
     prompt_fn: Callable[[str], str],
@@ -518,34 +769,41 @@ def resolve_destination(
     auto_rename: bool = False,
     overwrite: bool = False,
     new_name: Optional[str] = None,
+    existing: Optional[set[str]] = None,
 ) -> Optional[Path]:
     """Handle name collisions by prompting the user for a different name.
 
     Args:
         target: The target path to check for collisions
         prompt_fn: Function to prompt the user (default: input)
-        auto_rename: Automatically rename with _2 suffix if collision
+        auto_rename: Automatically rename with the first free _N suffix if collision
         overwrite: Overwrite existing file without prompting
         new_name: Use this specific name instead of prompting
+        existing: Names already in the target folder (from _scan_names); when
+            given, collisions are checked in memory instead of with stat()
 
     Returns:
         The final destination path, or None if user cancelled
     """
     candidate = target
-
-    # Handle auto-rename option
-    if auto_rename and candidate.exists():
-        suggested = candidate.parent / f"{candidate.stem}_2{candidate.suffix}"
-        return suggested
-
-    # Handle overwrite option
-    if overwrite and candidate.exists():
-        return candidate
+    # Existence of the current candidate; each candidate is checked once
+    exists: Optional[bool] = None
+
+    if auto_rename or overwrite:
+        exists = _taken(candidate, existing)
+        # Handle auto-rename option
+        if exists and auto_rename:
+            return _free_name(candidate, existing)
+        # Handle overwrite option
+        if exists:
+            return candidate
 
     # Handle explicit new name option
     if new_name:
         candidate = candidate.parent / new_name
-        if candidate.exists():
+        # The snapshot only covers target's folder; a subpath needs a stat()
+        same_folder = candidate.parent == target.parent
+        if _taken(candidate, existing if same_folder else None):
             print(
                 f"Error: Name '{new_name}' already exists in storage.", file=sys.stderr
             )
@@ -553,8 +811,10 @@ def resolve_destination(
         return candidate
 
     # Handle user prompting
-    while candidate.exists():
-        suggested = candidate.parent / f"{candidate.stem}_2{candidate.suffix}"
+    if exists is None:
+        exists = _taken(candidate, existing)
+    while exists:
+        suggested = _free_name(candidate, existing)
         message = (
             f"Entry '{candidate.name}' already exists.\n"
             f"\n"
@@ -576,16 +836,17 @@ def resolve_destination(
             return None
         if normalized == "r":
             candidate = suggested
+            exists = False
             continue
         if normalized == "o":
             return candidate
         # User entered their own name
         candidate = candidate.parent / Path(response).name
-        if candidate.exists():
+        exists = _taken(candidate, existing)
+        if exists:
             print(
                 f"Error: Name '{response}' already exists in storage.", file=sys.stderr
             )
-            continue
     return candidate
 
 
@@ -607,20 +868,23 @@ def save_entry(
         source: Path to the source file or folder
         storage: Optional custom storage directory
         prompt_fn: Function to prompt the user (default: input)
-        auto_rename: Automatically rename with _2 suffix if collision
+        auto_rename: Automatically rename with the first free _N suffix if collision
         overwrite: Overwrite existing file without prompting
         new_name: Use this specific name instead of prompting
     """
-    if not source.exists():
+    # One stat() answers both "does it exist" and "is it a folder"
+    kind = _classify(source)
+    if kind == "missing":
         raise FileNotFoundError(str(source))
 
     dest_dir = storage or ensure_storage_dir()
+    invalidate_index(dest_dir)
 
     # Handle folder import
-    if source.is_dir():
+    if kind == "dir":
         # Check for skill.md standard: single SKILL.md file → import as named file
         if is_single_skill_folder(source):
-            skill_file = list(source.iterdir())[0]  # The SKILL.md file
+            skill_file = source / "SKILL.md"
             target = dest_dir / f"{source.name}.md"
             final = resolve_destination(
                 target,
@@ -628,17 +892,18 @@ def save_entry(
                 auto_rename=auto_rename,
                 overwrite=overwrite,
                 new_name=new_name,
+                existing=_scan_names(dest_dir),
             )
             if final is None:
                 return None
-            shutil.copy2(skill_file, final)
+            _fast_copy(skill_file, final)
             print(f"Imported skill '{source.name}' as {final.name}")
             return final
 
         target_folder = dest_dir / source.name
 
         # Check if folder already exists
-        if target_folder.exists():
+        if _classify(target_folder) != "missing":
             # Merge into existing folder
             result = merge_folders(source, target_folder, prompt_fn)
             if result["merged"] or result["conflicts"]:
@@ -665,9 +930,10 @@ def save_entry(
 
     # Handle file import
     # Check if filename starts with any prohibited prefix
-    if source.stem in PROHIBITED_PREFIXES:
+    name = source.name
+    if _stem(name) in PROHIBITED_PREFIXES:
         print(
-            f"Error: '{source.name}' is a prohibited filename and cannot be saved.",
+            f"Error: '{name}' is a prohibited filename and cannot be saved.",
             file=sys.stderr,
         )
         return None
@@ -679,17 +945,125 @@ def save_entry(
         auto_rename=auto_rename,
         overwrite=overwrite,
         new_name=new_name,
+        existing=_scan_names(dest_dir),
     )
     if final is None:
         return None
-    shutil.copy2(source, final)
+    _fast_copy(source, final)
     return final
 
 
+def load_index(directory: Path) -> dict:
+    """Return the cached listing index for a storage folder (empty when missing)."""
+    import json
+
+    try:
+        with open(directory / INDEX_DIR / INDEX_FILE, encoding="utf-8") as handle:
+            index = json.load(handle)
+    except (OSError, ValueError):
+        index = None
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return {"version": INDEX_VERSION, "dirs": {}, "files": {}}
+    return index
+
+
+def save_index(directory: Path, index: dict) -> None:
+    """Atomically rewrite the listing index. Failures only cost a rescan later."""
+    import json
+
+    index_dir = directory / INDEX_DIR
+    tmp = index_dir / f"{INDEX_FILE}.{os.getpid()}.tmp"
+    try:
+        index_dir.mkdir(exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump(index, handle)
+        os.replace(tmp, index_dir / INDEX_FILE)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def invalidate_index(directory: Path) -> None:
+    """Drop the listing index so the next listing rescans the storage folder."""
+    try:
+        os.unlink(directory / INDEX_DIR / INDEX_FILE)
+    except FileNotFoundError:
+        pass
+
+
+def _listing_record(path: str, cached: Optional[dict]) -> dict:
+    """Return a folder's [name, is_dir] listing, rescanning if its mtime moved.
+
+    A record scanned within INDEX_RACY_NS of the folder's mtime is rescanned too.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    if (
+        cached is not None
+        and cached.get("mtime_ns") == mtime_ns
+        and _settled(cached, mtime_ns)
+    ):
+        return cached
+    scanned_ns = time.time_ns()
+    with os.scandir(path) as it:
+        entries = [
+            [entry.name, entry.is_dir()] for entry in it if _is_listed(entry.name)
+        ]
+    # Plain str comparisons on the name; no Path objects are built here
+    entries.sort(key=_entry_name)
+    return {"mtime_ns": mtime_ns, "scanned_ns": scanned_ns, "entries": entries}
+
+
+def _settled(record: dict, mtime_ns: int) -> bool:
+    """Return whether a cached record was scanned well after mtime_ns."""
+    return record.get("scanned_ns", 0) - mtime_ns >= INDEX_RACY_NS
+
+
+def _is_listed(name: str) -> bool:
+    """Return whether a storage name is an entry rather than pp's own bookkeeping.
+
+    Only the index folder and in-flight `.<name>.<pid>.tmp`/`.clone` siblings
+    are left out.
+    """
+    if name == INDEX_DIR:
+        return False
+    if name[:1] == "." and name.endswith((".tmp", ".clone")):
+        return not name.rsplit(".", 2)[-2].isdigit()
+    return True
+
+
+def _entry_name(entry: list) -> str:
+    """Sort key for [name, is_dir] listing entries."""
+    return entry[0]
+
+
+def _root_listing(directory: Path) -> list:
+    """Return the top-level storage listing, served from the index when fresh."""
+    index = load_index(directory)
+    cached = index["dirs"].get("")
+    record = _listing_record(str(directory), cached)
+    if record is not cached:
+        index["dirs"][""] = record
+        save_index(directory, index)
+    return record["entries"]
+
+
 def list_entries(storage: Optional[Path] = None) -> Iterable[Path]:
     """Return sorted stored entry names."""
     directory = storage or ensure_storage_dir()
-    return sorted(directory.iterdir())
+    return [directory / name for name, _ in _root_listing(directory)]
+
+
+def complete_entries(storage: Optional[Path] = None) -> list[str]:
+    """Return entry ids for shell completion, straight from the listing index."""
+    directory = storage or ensure_storage_dir()
+    stems = {
+        os.path.splitext(name)[0]
+        for name, is_dir in _root_listing(directory)
+        if not is_dir
+    }
+    return sorted(stems)
 
 
 # ANSI color codes for terminal output
@@ -698,70 +1072,267 @@ COLOR_CYAN = "\033[96m"
 COLOR_GREEN = "\033[92m"
 COLOR_YELLOW = "\033[93m"
 
+# Byte budgets for reading previews in list_entries_with_preview
+PREVIEW_READ_LIMIT = 4096
+PREVIEW_CHUNK_SIZE = 65536
+# Above this many unread files, previews are read on a thread pool
+PREVIEW_POOL_THRESHOLD = 8
+
+
+def _list_formats(cyan: str, green: str, yellow: str, reset: str) -> dict:
+    """Build the per-entry output templates used by list_entries_with_preview."""
+    entry = (
+        f"{{prefix}}{cyan}> {{name}}{reset}\n"
+        f"{{prefix}}{green}  (lines: {{lines}}, chars: {{chars}}){reset}\n"
+    )
+    return {
+        "dir": f"{{prefix}}{cyan}[DIR] {{name}}/{reset}\n\n",
+        "unreadable": f"{{prefix}}{cyan}> {{name}}{reset}\n\n",
+        "entry": entry + "\n",
+        "preview": entry + f"{{prefix}}{yellow}  {{first_line}}{reset}\n\n",
+    }
+
+
+LIST_FORMATS_TTY = _list_formats(COLOR_CYAN, COLOR_GREEN, COLOR_YELLOW, COLOR_RESET)
+LIST_FORMATS_PLAIN = _list_formats("", "", "", "")
+
+# Indent strings by nesting depth, grown on demand by _indent
+_PREFIXES = [""]
+
+
+def _indent(depth: int) -> str:
+    """Return the cached listing indent for a nesting depth."""
+    while len(_PREFIXES) <= depth:
+        _PREFIXES.append(_PREFIXES[-1] + "  ")
+    return _PREFIXES[depth]
+
+
+def _read_preview(path: str) -> Optional[dict]:
+    """Stream a file and return its line/char counts and truncated first line.
+
+    The file is scanned once in fixed-size binary chunks: the first chunk
+    yields the first line, and every chunk is only newline-counted in C.
+    Only the first line is decoded, so "chars" is the file size in bytes.
+    Returns None if the file is unreadable.
+    """
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read(PREVIEW_CHUNK_SIZE)
+            end = data.find(b"\n", 0, PREVIEW_READ_LIMIT)
+            head = data[: end if end >= 0 else PREVIEW_READ_LIMIT]
+            lines = data.count(b"\n") + 1
+            chars = len(data)
+            for chunk in iter(lambda: handle.read(PREVIEW_CHUNK_SIZE), b""):
+                lines += chunk.count(b"\n")
+                chars += len(chunk)
+    except Exception:
+        return None
+    # Get first line and limit to 64 characters
+    first_line = head.decode("utf-8", errors="ignore").strip()
+    if len(first_line) > 64:
+        first_line = first_line[:64] + "..."
+    return {"lines": lines, "chars": chars, "first_line": first_line}
+
+
+def _collect_listing(directory: Path) -> tuple[list, dict]:
+    """Walk storage through the listing index and return (rows, previews).
+
+    Rows are (indent, name, is_dir, path, key) tuples in display order and
+    previews maps each file key to its preview (None if unreadable). Cached
+    previews are reused while a file's mtime and size are unchanged and the
+    preview was read at least INDEX_RACY_NS after that mtime; stale
+    ones are re-read, on a thread pool when there are many. The index is
+    rewritten only if something changed.
+    """
+    index = load_index(directory)
+    fresh = {"version": INDEX_VERSION, "dirs": {}, "files": {}}
+    dirty = False
+    rows: list = []
+
+    def walk_directory(path: str, key: str = "", indent: int = 0) -> None:
+        """Recursively walk directory and collect entries."""
+        nonlocal dirty
+        cached = index["dirs"].get(key)
+        record = _listing_record(path, cached)
+        if record is not cached:
+            dirty = True
+        fresh["dirs"][key] = record
+        # Entries are already sorted by name; list folders first, keeping order
+        entries = record["entries"]
+        items = [e for e in entries if e[1]] + [e for e in entries if not e[1]]
+
+        for name, is_dir in items:
+            child = os.path.join(path, name)
+            child_key = f"{key}/{name}" if key else name
+            rows.append((indent, name, is_dir, child, child_key))
+            if is_dir:
+                walk_directory(child, child_key, indent + 1)
+
+    walk_directory(str(directory))
+
+    # Reuse cached previews for unchanged files; read only the stale ones
+    previews: dict = {}
+    stale: list = []
+    for _, _, is_dir, path, key in rows:
+        if is_dir:
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            previews[key] = None
+            continue
+        preview = index["files"].get(key)
+        if (
+            preview is not None
+            and preview.get("mtime_ns") == st.st_mtime_ns
+            and preview.get("size") == st.st_size
+            and _settled(preview, st.st_mtime_ns)
+        ):
+            previews[key] = preview
+        else:
+            stale.append((path, key, st))
+
+    if stale:
+        dirty = True
+        scanned_ns = time.time_ns()
+        paths = [path for path, _, _ in stale]
+        if len(paths) > PREVIEW_POOL_THRESHOLD:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+                results = list(pool.map(_read_preview, paths))
+        else:
+            results = [_read_preview(path) for path in paths]
+        for (_, key, st), preview in zip(stale, results):
+            if preview is not None:
+                preview.update(
+                    mtime_ns=st.st_mtime_ns, size=st.st_size, scanned_ns=scanned_ns
+                )
+            previews[key] = preview
+    fresh["files"] = {key: p for key, p in previews.items() if p is not None}
+
+    if dirty:
+        save_index(directory, fresh)
+    return rows, previews
+
 
 def list_entries_with_preview(storage: Optional[Path] = None) -> None:
-    """Print stored entries with filename, lines + chars, and first line preview."""
+    """Print stored entries with filename, lines + chars, and first line preview.
+
+    Previews come from the listing index (see _collect_listing), so repeated
+    listings skip reading unchanged files.
+    """
     directory = storage or ensure_storage_dir()
+    rows, previews = _collect_listing(directory)
+
+    # Collect output and write it once; pick the color or plain templates
+    # once per call rather than per entry
+    formats = LIST_FORMATS_TTY if sys.stdout.isatty() else LIST_FORMATS_PLAIN
+    out: list[str] = []
+
+    for indent, name, is_dir, _, key in rows:
+        prefix = _indent(indent)
+        if is_dir:
+            out.append(formats["dir"].format(prefix=prefix, name=name))
+            continue
+        preview = previews[key]
+        if preview is None:
+            out.append(formats["unreadable"].format(prefix=prefix, name=name))
+            continue
+        fmt = formats["preview"] if preview["first_line"] else formats["entry"]
+        out.append(fmt.format(prefix=prefix, name=name, **preview))
+
+    sys.stdout.write("".join(out))
 
-    def print_entry(entry: Path, indent: int = 0) -> None:
-        """Print a single entry with indentation."""
-        try:
-            content = entry.read_text(encoding="utf-8", errors="ignore")
-            lines = content.count("\n") + 1
-            chars = len(content)
-            # Format filename with color and indentation
-            prefix = "  " * indent
-            print(f"{prefix}{COLOR_CYAN}> {entry.name}{COLOR_RESET}")
-            print(
-                f"{prefix}{COLOR_GREEN}  (lines: {lines}, chars: {chars}){COLOR_RESET}"
-            )
-            # Get first line and limit to 64 characters
-            first_line = content.split("\n")[0].strip()
-            if first_line:
-                if len(first_line) > 64:
-                    first_line = first_line[:64] + "..."
-                print(f"{prefix}{COLOR_YELLOW}  {first_line}{COLOR_RESET}\n")
-            else:
-                print()
-        except Exception:
-            prefix = "  " * indent
-            print(f"{prefix}{COLOR_CYAN}> {entry.name}{COLOR_RESET}\n")
-
-    def walk_directory(path: Path, indent: int = 0) -> None:
-        """Recursively walk directory and print entries."""
-        items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name))
-
-        for item in items:
-            if item.is_dir():
-                # Print folder name
-                prefix = "  " * indent
-                print(f"{prefix}{COLOR_CYAN}[DIR] {item.name}/{COLOR_RESET}\n")
-                # Recursively walk subdirectory
-                walk_directory(item, indent + 1)
-            else:
-                # Print file
-                print_entry(item, indent)
 
-    walk_directory(directory)
+# Extensions probed directly by find_entry_by_id, in lexicographic order
+ENTRY_PROBE_SUFFIXES = ("", ".md", ".txt")
 
 
 def find_entry_by_id(name: str, directory: Path) -> Path:
-    """Return the stored file whose stem matches the requested id."""
-    matches = [entry for entry in directory.iterdir() if entry.stem == name]
-    if not matches:
-        raise FileNotFoundError(name)
-    return sorted(matches)[0]
+    """Return the stored file whose stem matches the requested id.
+
+    The common spellings (name, name.md, name.txt) are probed directly, so a
+    hit costs a stat() or two; other extensions fall back to a listing scan.
+    """
+    # Only plain names are probed; ids with separators never match a stem
+    if name and "/" not in name and os.sep not in name and name not in (".", ".."):
+        suffixes = ENTRY_PROBE_SUFFIXES
+        if os.path.splitext(name)[1]:
+            # A bare probe only matches by stem when the name has no extension
+            suffixes = suffixes[1:]
+        for suffix in suffixes:
+            candidate = directory / f"{name}{suffix}"
+            if _is_file(candidate):
+                return candidate
+    for entry, _ in _root_listing(directory):
+        if os.path.splitext(entry)[0] == name:
+            # Listings are sorted by name, so the first match is the smallest
+            return directory / entry
+    raise FileNotFoundError(name)
+
+
+# Chunk size when stream_entry cannot use os.sendfile
+STREAM_CHUNK_SIZE = 65536
+
+
+def _locate_entry(name: str, directory: Path) -> Path:
+    """Resolve an entry id or hierarchical path to its stored file."""
+    try:
+        return get_entry_by_path(name, directory)
+    except FileNotFoundError:
+        # Fall back to old behavior for backward compatibility
+        return find_entry_by_id(name, directory)
 
 
 def read_entry(name: str, storage: Optional[Path] = None) -> str:
     """Return the contents of a stored entry id."""
     directory = storage or ensure_storage_dir()
-    try:
-        entry = get_entry_by_path(name, directory)
-    except FileNotFoundError:
-        # Fall back to old behavior for backward compatibility
-        entry = find_entry_by_id(name, directory)
-    return entry.read_text(encoding="utf-8", errors="ignore")
+    entry = _locate_entry(name, directory)
+    st = os.stat(entry)
+    return _read_entry_cached(str(entry), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_entry_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read an entry's text; keying on mtime and size makes edits miss the cache."""
+    with open(path, encoding="utf-8", errors="ignore") as handle:
+        return handle.read()
+
+
+def stream_entry(
+    name: str, storage: Optional[Path] = None, out: Optional[BinaryIO] = None
+) -> None:
+    """Copy a stored entry's raw bytes to a binary stream (stdout by default).
+
+    Unlike read_entry, the content is never decoded into a str. Uses
+    os.sendfile when the stream is backed by a file descriptor that accepts it.
+    """
+    directory = storage or ensure_storage_dir()
+    entry = _locate_entry(name, directory)
+    if out is None:
+        sys.stdout.flush()
+        out = sys.stdout.buffer
+    with open(entry, "rb") as handle:
+        offset = 0
+        if hasattr(os, "sendfile"):
+            try:
+                out.flush()
+                out_fd = out.fileno()
+                size = os.fstat(handle.fileno()).st_size
+                while offset < size:
+                    sent = os.sendfile(out_fd, handle.fileno(), offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+                else:
+                    return
+            except (OSError, AttributeError):
+                pass
+        import shutil
+
+        handle.seek(offset)
+        shutil.copyfileobj(handle, out, STREAM_CHUNK_SIZE)
 
 
 def remove_entry(name: str, storage: Optional[Path] = None) -> None:
@@ -769,24 +1340,244 @@ def remove_entry(name: str, storage: Optional[Path] = None) -> None:
     directory = storage or ensure_storage_dir()
     entry = find_entry_by_id(name, directory)
     entry.unlink()
+    invalidate_index(directory)
+
+
+# File manager command for `pp store`, resolved once (None means os.startfile)
+if _IS_WIN:
+    _OPENER: Optional[str] = None
+elif _IS_MAC:
+    _OPENER = "open"
+else:
+    _OPENER = "xdg-open"
 
 
 def open_storage(storage: Optional[Path] = None) -> None:
     """Open the storage directory in the OS file manager or editor."""
     directory = storage or ensure_storage_dir()
-    if sys.platform.startswith("win"):
+    if _OPENER is None:
         os.startfile(str(directory))
         return
-    opener = "open" if sys.platform == "darwin" else "xdg-open"
+    import subprocess
+
     try:
-        subprocess.run([opener, str(directory)], check=True)
+        subprocess.run([_OPENER, str(directory)], check=True)
     except (subprocess.CalledProcessError, FileNotFoundError):
         editor = os.environ.get("EDITOR", "vi")
         subprocess.run([editor, str(directory)])
 
 
+# inotify event bits from <sys/inotify.h>, used by watch_storage
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+# struct inotify_event header: wd, mask, cookie, len
+_INOTIFY_EVENT = struct.Struct("iIII")
+# Quiet period that batches a burst of events into one index refresh
+WATCH_DEBOUNCE_SECONDS = 0.2
+
+
+def _inotify_events(data: bytes) -> Iterator[tuple[int, int, str]]:
+    """Decode a buffer of raw inotify events into (wd, mask, name) tuples."""
+    offset = 0
+    while offset < len(data):
+        wd, mask, _cookie, length = _INOTIFY_EVENT.unpack_from(data, offset)
+        offset += _INOTIFY_EVENT.size
+        name = data[offset : offset + length].rstrip(b"\0")
+        offset += length
+        yield wd, mask, os.fsdecode(name)
+
+
+def watch_storage(storage: Optional[Path] = None) -> None:
+    """Keep the listing index current by watching storage with inotify (Linux).
+
+    Runs until interrupted. Each burst of create/delete/move/write events
+    triggers one index refresh, so `pp list` finds every preview cached.
+    Without a running watcher the index still falls back to mtime checks.
+
+    Raises:
+        OSError: If inotify is unavailable on this platform
+    """
+    directory = storage or ensure_storage_dir()
+    if not _IS_LINUX:
+        raise OSError(errno.ENOSYS, "pp watch requires Linux inotify")
+    import ctypes
+    import select
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    fd = libc.inotify_init1(os.O_CLOEXEC)
+    if fd < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    watches: dict[int, str] = {}
+
+    def add_tree(root: str) -> None:
+        """Watch a folder and its listed subfolders."""
+        for path, dirs, _ in os.walk(root):
+            dirs[:] = [d for d in dirs if _is_listed(d)]
+            wd = libc.inotify_add_watch(fd, os.fsencode(path), _WATCH_MASK)
+            if wd >= 0:
+                watches[wd] = path
+
+    try:
+        add_tree(str(directory))
+        _collect_listing(directory)
+        while True:
+            data = os.read(fd, 65536)
+            # Drain the rest of the burst before refreshing
+            while select.select([fd], [], [], WATCH_DEBOUNCE_SECONDS)[0]:
+                data += os.read(fd, 65536)
+            changed = False
+            for wd, mask, name in _inotify_events(data):
+                if mask & _IN_IGNORED:
+                    watches.pop(wd, None)
+                    continue
+                # Skip the index folder and pp's own temporary siblings
+                if not _is_listed(name):
+                    continue
+                changed = True
+                created = mask & (_IN_CREATE | _IN_MOVED_TO)
+                if mask & _IN_ISDIR and created and wd in watches:
+                    add_tree(os.path.join(watches[wd], name))
+            if changed:
+                _collect_listing(directory)
+    finally:
+        os.close(fd)
+
+
+def _setup_stdout() -> None:
+    """Make text output UTF-8 on Windows consoles (called from main only)."""
+    # Try to set UTF-8 encoding for stdout
+    try:
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    except (AttributeError, LookupError):
+        # Fallback: wrap stdout with a UTF-8 encoder
+        if hasattr(sys.stdout, "buffer"):
+            import io
+
+            sys.stdout = io.TextIOWrapper(
+                sys.stdout.buffer,
+                encoding="utf-8",
+                errors="replace",
+                newline=None,
+                write_through=True,
+            )
+
+
+def _show_entry(name: str, storage: Path) -> int:
+    """Print an entry for `pp <name>`; missing entries are silently ignored."""
+    out = getattr(sys.stdout, "buffer", None)
+    try:
+        if out is None:
+            print(read_entry(name, storage=storage))
+            return 0
+        stream_entry(name, storage=storage, out=out)
+    except FileNotFoundError:
+        return 0
+    out.write(b"\n")
+    out.flush()
+    return 0
+
+
+def _do_save(parser, rest: list[str], args, storage: Path) -> int:
+    """Handle `pp save|add <path>`."""
+    if not rest:
+        parser.error(f"{args.command[0]} requires a filepath argument")
+    source = Path(rest[0]).expanduser()
+    try:
+        final = save_entry(
+            source,
+            storage=storage,
+            auto_rename=args.rename,
+            overwrite=args.overwrite,
+            new_name=args.new_name,
+        )
+    except FileNotFoundError as exc:
+        print(f"Error: source file/folder not found: {exc}", file=sys.stderr)
+        return 1
+    if final:
+        print(f"Saved entry as {final.name}")
+    return 0
+
+
+def _do_list(parser, rest: list[str], args, storage: Path) -> int:
+    """Handle `pp list`."""
+    list_entries_with_preview(storage)
+    return 0
+
+
+def _do_rm(parser, rest: list[str], args, storage: Path) -> int:
+    """Handle `pp rm <name>`."""
+    if not rest:
+        parser.error("rm requires an entry name")
+    remove_entry(rest[0], storage=storage)
+    print(f"Removed entry {rest[0]}")
+    return 0
+
+
+def _do_store(parser, rest: list[str], args, storage: Path) -> int:
+    """Handle `pp store`."""
+    open_storage(storage)
+    return 0
+
+
+def _do_watch(parser, rest: list[str], args, storage: Path) -> int:
+    """Handle `pp watch`."""
+    if not _IS_LINUX:
+        print("Error: pp watch requires Linux inotify", file=sys.stderr)
+        return 1
+    print(f"Watching {storage} (Ctrl+C to stop)")
+    try:
+        watch_storage(storage)
+    except KeyboardInterrupt:
+        pass
+    except OSError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+# Built-in subcommands; anything else on the command line is an entry name
+COMMANDS = {
+    "save": _do_save,
+    "add": _do_save,
+    "list": _do_list,
+    "rm": _do_rm,
+    "store": _do_store,
+    "watch": _do_watch,
+}
+
+
 def main(argv: Optional[Iterable[str]] = None) -> int:
     """Command-line entry point."""
+    argv = list(sys.argv[1:] if argv is None else argv)
+
+    # Fast path: `pp <name>` needs no option parsing, so skip argparse entirely;
+    # entries are written as raw bytes, so stdout needs no setup either
+    if (
+        len(argv) == 1
+        and argv[0] not in COMMANDS
+        and argv[0] != COMPLETE_COMMAND
+        and not argv[0].startswith("-")
+    ):
+        return _show_entry(argv[0], ensure_storage_dir())
+
+    if _IS_WIN:
+        _setup_stdout()
+
+    # Shell completion hook: print entry ids, one per line, and nothing else
+    if argv == [COMPLETE_COMMAND]:
+        names = complete_entries(ensure_storage_dir())
+        sys.stdout.write("".join(f"{name}\n" for name in names))
+        return 0
+
+    import argparse
+
     parser = argparse.ArgumentParser(prog="pp", add_help=False)
     parser.add_argument("command", nargs="*", help="Command or entry name")
     parser.add_argument("--help", action="help", help="Show this message and exit")
@@ -796,7 +1587,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         "-r",
         "--rename",
         action="store_true",
-        help="Auto-rename with _2 suffix if collision",
+        help="Auto-rename with the first free _2, _3, ... suffix if collision",
     )
     parser.add_argument(
         "-o",
@@ -817,50 +1608,14 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
     storage = ensure_storage_dir()
 
     try:
-        if head in {"save", "add"}:
-            if not rest:
-                parser.error(f"{head} requires a filepath argument")
-            source = Path(rest[0]).expanduser()
-            final = save_entry(
-                source,
-                storage=storage,
-                auto_rename=args.rename,
-                overwrite=args.overwrite,
-                new_name=args.new_name,
-            )
-            if final:
-                print(f"Saved entry as {final.name}")
-            return 0
-
-        if head == "list":
-            list_entries_with_preview(storage)
-            return 0
-
-        if head == "rm":
-            if not rest:
-                parser.error("rm requires an entry name")
-            remove_entry(rest[0], storage=storage)
-            print(f"Removed entry {rest[0]}")
-            return 0
-
-        if head == "store":
-            open_storage(storage)
-            return 0
-
+        handler = COMMANDS.get(head)
+        if handler is not None:
+            return handler(parser, rest, args, storage)
         if rest:
             parser.error("too many arguments")
-        try:
-            content = read_entry(head, storage=storage)
-        except FileNotFoundError:
-            return 0
-        print(content)
-        return 0
-
+        return _show_entry(head, storage)
     except FileNotFoundError as exc:
-        if head in {"save", "add"}:
-            print(f"Error: source file/folder not found: {exc}", file=sys.stderr)
-        else:
-            print(f"Error: {exc}", file=sys.stderr)
+        print(f"Error: {exc}", file=sys.stderr)
         return 1
 
 
@@ -0,0 +1,16 @@
+# Bash completion for pp (PromptPaste).
+# Enable it by adding this line to ~/.bashrc:
+#   source /path/to/promptpaste/scripts/pp-completion.bash
+
+_pp() {
+    local cur="${COMP_WORDS[COMP_CWORD]}"
+    if [[ $COMP_CWORD -eq 1 ]]; then
+        COMPREPLY=( $(compgen -W "save add list rm store watch $(pp __complete 2>/dev/null)" -- "$cur") )
+    elif [[ $COMP_CWORD -eq 2 && "${COMP_WORDS[1]}" == "rm" ]]; then
+        COMPREPLY=( $(compgen -W "$(pp __complete 2>/dev/null)" -- "$cur") )
+    elif [[ "${COMP_WORDS[1]}" == "save" || "${COMP_WORDS[1]}" == "add" ]]; then
+        COMPREPLY=( $(compgen -f -- "$cur") )
+    fi
+}
+
+complete -F _pp pp
@@ -1,23 +1,33 @@
 import contextlib
 import io
+import itertools
 import os
 import shutil
+import struct
+import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from promptpaste import (
     STORAGE_ENV,
+    _inotify_events,
+    _reset_cache,
     confirm_folder_import,
     confirm_merge,
     copy_file_with_collision_handling,
     detect_conflicts,
+    detect_conflicts_from_list,
     discover_folder_files,
+    ensure_storage_dir,
     get_entry_by_path,
     get_folder_structure,
     import_folder,
     is_eligible_file,
+    is_single_skill_folder,
     list_entries,
+    list_entries_with_preview,
     main,
     merge_folders,
     normalize_path,
@@ -26,28 +36,156 @@ from promptpaste import (
     resolve_conflict_with_prepend,
     resolve_path,
     save_entry,
+    stream_entry,
 )
 
+# Message main() prints when a save source is missing
+_ERR_SRC_NOT_FOUND = "source file/folder not found"
+
+# Optional parent folder for the per-process test roots
+TEST_ROOT_ENV = "PP_TEST_ROOT"
+
+# Fixture strings used across many tests, encoded once
+_FIXTURES = {
+    text: text.encode("utf-8")
+    for text in (
+        "content",
+        "content1",
+        "content2",
+        "old content",
+        "new content",
+        "source content",
+        "target content",
+        "bye",
+        "1",
+        "2",
+        "one",
+        "two",
+        "echo 'hello'",
+    )
+}
+
+
+def _encode(text: str) -> bytes:
+    return _FIXTURES.get(text) or text.encode("utf-8")
+
+
+def _fast_rmtree(path) -> None:
+    """Remove a fixture tree, reusing scandir's d_type instead of lstat()."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def setUpModule():
+    # Pay first-call costs up front so they don't land on whichever test runs
+    # first; doubles as an import smoke check
+    normalize_path("a")
+    resolve_path("a", Path("storage"))
+    is_eligible_file(Path("x.md"))
+
 
 class PromptPasteTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One root per class and process (so parallel runners never share one),
+        # under PP_TEST_ROOT or tmpfs when available; removed once at the end
+        base = os.environ.get(TEST_ROOT_ENV)
+        if base:
+            os.makedirs(base, exist_ok=True)
+        elif os.path.isdir("/dev/shm"):
+            base = "/dev/shm"
+        cls._root = Path(tempfile.mkdtemp(prefix=f"pp-{os.getpid()}-", dir=base))
+        # Per-test subfolders are numbered; the class root is already unique
+        cls._counter = itertools.count()
+        # Shared stderr capture, emptied before every test
+        cls._err_buf = io.StringIO()
+        # Read-only source folder, hardlinked into tests by _template_folder
+        cls._template = cls._root / "template" / "test_folder"
+        cls._tree({"file1.md": "content1", "file2.txt": "content2"}, cls._template)
+
+    @classmethod
+    def tearDownClass(cls):
+        _fast_rmtree(cls._root)
+
     def setUp(self):
-        root = Path(tempfile.mkdtemp())
-        self.storage = root / "prompt_paste"
-        self.storage.mkdir()
-        self.workspace = root / "work"
-        self.workspace.mkdir()
+        base = self._root / f"t{next(self._counter)}"
+        self.storage = base / "prompt_paste"
+        self.workspace = base / "work"
+        os.makedirs(self.storage)
+        os.mkdir(self.workspace)
+        self._err_buf.seek(0)
+        self._err_buf.truncate(0)
+        # CLI entry points find storage through the environment
+        self._prev_storage_env = os.environ.pop(STORAGE_ENV, None)
+        os.environ[STORAGE_ENV] = str(self.storage)
+        _reset_cache()
 
     def tearDown(self):
-        shutil.rmtree(self.storage.parent, ignore_errors=True)
+        if self._prev_storage_env is None:
+            os.environ.pop(STORAGE_ENV, None)
+        else:
+            os.environ[STORAGE_ENV] = self._prev_storage_env
+
+    def _names(self, directory: Path) -> set:
+        """Snapshot a folder's entry names with one scandir call."""
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+
+    def _write(self, path: Path, text: str) -> None:
+        path.write_bytes(_encode(text))
 
     def _source(self, name: str, text: str) -> Path:
         path = self.workspace / name
-        path.write_text(text)
+        self._write(path, text)
         return path
 
+    @staticmethod
+    def _tree(spec: dict, root: Path) -> None:
+        """Write {relative path: text} fixtures, creating each parent once."""
+        for parent in {os.path.dirname(rel) for rel in spec}:
+            os.makedirs(root / parent, exist_ok=True)
+        for rel, text in spec.items():
+            fd = os.open(root / rel, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, _encode(text))
+            finally:
+                os.close(fd)
+
+    def _writev(self, path: Path, chunks: list) -> None:
+        """Write byte chunks to path with one writev() where available."""
+        if not hasattr(os, "writev"):
+            path.write_bytes(b"".join(chunks))
+            return
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.writev(fd, chunks)
+        finally:
+            os.close(fd)
+
+    def _template_folder(self) -> Path:
+        """Link the shared file1.md/file2.txt template in as workspace/test_folder.
+
+        Only for tests that never modify the source folder.
+        """
+        folder = self.workspace / "test_folder"
+        os.mkdir(folder)
+        for name in os.listdir(self._template):
+            try:
+                os.link(self._template / name, folder / name)
+            except OSError:
+                (folder / name).write_bytes((self._template / name).read_bytes())
+        return folder
+
     def _prompt(self, responses):
+        answers = iter(responses)
+
         def responder(_msg: str) -> str:
-            return responses.pop(0)
+            return next(answers)
 
         return responder
 
@@ -68,6 +206,65 @@ class PromptPasteTests(unittest.TestCase):
         self.assertTrue(saved.name.endswith("_2.md"))
         self.assertEqual("two", read_entry("snippet_2", storage=self.storage))
 
+    def test_save_entry_auto_rename_skips_taken_names(self):
+        self._write(self.storage / "snippet.md", "one")
+        self._write(self.storage / "snippet_2.md", "two")
+        source = self._source("snippet.md", "three")
+        saved = save_entry(source, storage=self.storage, auto_rename=True)
+        self.assertEqual(self.storage / "snippet_3.md", saved)
+        self.assertEqual("two", (self.storage / "snippet_2.md").read_bytes().decode())
+        self.assertEqual("three", saved.read_bytes().decode())
+
+    def test_save_entry_onto_itself_keeps_content(self):
+        entry = self.storage / "x.md"
+        self._write(entry, "keep me")
+        with self.assertRaises(shutil.SameFileError):
+            save_entry(entry, storage=self.storage, overwrite=True)
+        self.assertEqual("keep me", entry.read_bytes().decode())
+        self.assertEqual({"x.md"}, self._names(self.storage) - {".index"})
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "FICLONE is Linux-only")
+    def test_save_entry_clones_new_entries_only(self):
+        def fake_ficlone(fd, _request, src_fd):
+            os.write(fd, os.pread(src_fd, 1 << 16, 0))
+            return 0
+
+        target = self.workspace / "target.md"
+        self._write(target, "old")
+        target.chmod(0o600)
+        link = self.storage / "linked.md"
+        link.symlink_to(target)
+        with mock.patch("promptpaste._NO_CLONE_DEVICES", set()):
+            with mock.patch("fcntl.ioctl", side_effect=fake_ficlone) as ioctl:
+                fresh = save_entry(
+                    self._source("fresh.md", "cloned"), storage=self.storage
+                )
+                self.assertEqual(1, ioctl.call_count)
+                save_entry(
+                    self._source("linked.md", "new"),
+                    storage=self.storage,
+                    overwrite=True,
+                )
+                self.assertEqual(1, ioctl.call_count)
+        self.assertEqual("cloned", fresh.read_bytes().decode())
+        self.assertTrue(link.is_symlink())
+        self.assertEqual("new", target.read_bytes().decode())
+        self.assertEqual(0o600, target.stat().st_mode & 0o777)
+        self.assertEqual(
+            {"fresh.md", "linked.md"}, self._names(self.storage) - {".index"}
+        )
+
+    def test_save_entry_new_name_subpath_collision(self):
+        (self.storage / "bucket").mkdir()
+        existing = self.storage / "bucket" / "foo.md"
+        self._write(existing, "old")
+        source = self._source("snippet.md", "new")
+        with contextlib.redirect_stderr(self._err_buf):
+            result = save_entry(source, storage=self.storage, new_name="bucket/foo.md")
+        self.assertIsNone(result)
+        self.assertIn("already exists", self._err_buf.getvalue())
+        self.assertEqual("old", existing.read_bytes().decode())
+
     def test_save_entry_cancelled(self):
         source = self._source("snippet.txt", "one")
         save_entry(source, storage=self.storage)
@@ -76,126 +273,249 @@ class PromptPasteTests(unittest.TestCase):
         result = save_entry(second, storage=self.storage, prompt_fn=prompt)
         self.assertIsNone(result)
 
+    def test_save_entry_rejects_prohibited_name(self):
+        source = self._source("list.md", "content")
+        with contextlib.redirect_stderr(self._err_buf):
+            result = save_entry(source, storage=self.storage)
+        self.assertIsNone(result)
+        self.assertFalse((self.storage / "list.md").exists())
+
     def test_list_and_read(self):
-        (self.storage / "one.md").write_text("1")
-        (self.storage / "two.txt").write_text("2")
+        self._write(self.storage / "one.md", "1")
+        self._write(self.storage / "two.txt", "2")
         entries = list_entries(storage=self.storage)
         self.assertEqual(["one.md", "two.txt"], [entry.name for entry in entries])
         self.assertEqual("2", read_entry("two", storage=self.storage))
 
+    def test_list_entries_index_tracks_changes(self):
+        self._write(self.storage / "one.md", "1")
+        self.assertEqual(["one.md"], [e.name for e in list_entries(self.storage)])
+        self.assertTrue((self.storage / ".index" / "listing.json").exists())
+        self._write(self.storage / "two.txt", "2")
+        entries = list_entries(storage=self.storage)
+        self.assertEqual(["one.md", "two.txt"], [entry.name for entry in entries])
+
+    def test_list_entries_includes_dotfiles(self):
+        self._write(self.storage / ".cursorrules", "rules")
+        self._write(self.storage / "a.md", "a")
+        self._write(self.storage / ".a.md.123.tmp", "partial")
+        entries = list_entries(storage=self.storage)
+        self.assertEqual([".cursorrules", "a.md"], [e.name for e in entries])
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            list_entries_with_preview(self.storage)
+        self.assertIn(".cursorrules", buffer.getvalue())
+        self.assertNotIn(".a.md.123.tmp", buffer.getvalue())
+
+    def test_list_preview_refreshes_edited_entry(self):
+        entry = self.storage / "one.md"
+        self._write(entry, "first version")
+        with contextlib.redirect_stdout(io.StringIO()):
+            list_entries_with_preview(self.storage)
+        self._write(entry, "second version, longer")
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            list_entries_with_preview(self.storage)
+        self.assertIn("second version, longer", buffer.getvalue())
+        self.assertNotIn(".index", buffer.getvalue())
+
+    def test_listing_rescans_racily_clean_records(self):
+        entry = self.storage / "one.md"
+        self._write(entry, "first")
+        with contextlib.redirect_stdout(io.StringIO()):
+            list_entries_with_preview(self.storage)
+        # Same-tick edits on a coarse-timestamp filesystem leave mtimes unchanged
+        folder_ns = self.storage.stat().st_mtime_ns
+        entry_ns = entry.stat().st_mtime_ns
+        self._write(entry, "again")
+        self._write(self.storage / "two.md", "2")
+        os.utime(entry, ns=(entry_ns, entry_ns))
+        os.utime(self.storage, ns=(folder_ns, folder_ns))
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            list_entries_with_preview(self.storage)
+        self.assertIn("again", buffer.getvalue())
+        self.assertIn("two.md", buffer.getvalue())
+
+    def test_list_preview_many_entries(self):
+        for i in range(12):
+            self._write(self.storage / f"note{i:02}.md", f"note number {i}\nmore")
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            list_entries_with_preview(self.storage)
+        output = buffer.getvalue()
+        for i in range(12):
+            self.assertIn(f"note number {i}", output)
+        self.assertLess(output.index("note00.md"), output.index("note11.md"))
+
+    def test_read_entry_sees_edits(self):
+        entry = self.storage / "note.md"
+        self._write(entry, "before")
+        self.assertEqual("before", read_entry("note", storage=self.storage))
+        self._write(entry, "after edit")
+        self.assertEqual("after edit", read_entry("note", storage=self.storage))
+
+    def test_stream_entry_to_buffer(self):
+        (self.storage / "note.md").write_bytes("héllo\nworld".encode("utf-8"))
+        buffer = io.BytesIO()
+        stream_entry("note", storage=self.storage, out=buffer)
+        self.assertEqual("héllo\nworld".encode("utf-8"), buffer.getvalue())
+
+    def test_stream_entry_to_file(self):
+        self._write(self.storage / "note.md", "to a file")
+        target = self.workspace / "out.txt"
+        with open(target, "wb") as handle:
+            stream_entry("note", storage=self.storage, out=handle)
+        self.assertEqual("to a file", target.read_bytes().decode())
+
     def test_remove_entry(self):
-        (self.storage / "bye.md").write_text("bye")
+        self._write(self.storage / "bye.md", "bye")
         remove_entry("bye", storage=self.storage)
         self.assertFalse((self.storage / "bye.md").exists())
         with self.assertRaises(FileNotFoundError):
             remove_entry("bye", storage=self.storage)
 
+    def test_remove_entry_other_extension(self):
+        self._write(self.storage / "script.py", "print(1)")
+        remove_entry("script", storage=self.storage)
+        self.assertFalse((self.storage / "script.py").exists())
+
+    def test_remove_entry_ignores_paths(self):
+        self._write(self.workspace / "outside.md", "keep me")
+        with self.assertRaises(FileNotFoundError):
+            remove_entry("../work/outside", storage=self.storage)
+        self.assertTrue((self.workspace / "outside.md").exists())
+
     def test_retrieve_missing_silent(self):
-        previous = os.environ.get(STORAGE_ENV)
-        os.environ[STORAGE_ENV] = str(self.storage)
-        try:
-            result = main(["missing"])
-        finally:
-            if previous is None:
-                os.environ.pop(STORAGE_ENV, None)
-            else:
-                os.environ[STORAGE_ENV] = previous
+        result = main(["missing"])
         self.assertEqual(0, result)
 
-    def test_save_missing_error(self):
-        previous = os.environ.get(STORAGE_ENV)
-        os.environ[STORAGE_ENV] = str(self.storage)
+    def test_cli_prints_entry(self):
+        self._write(self.storage / "hello.md", "hi there")
         buffer = io.StringIO()
-        try:
-            with contextlib.redirect_stderr(buffer):
-                result = main(["save", "missing.txt"])
-        finally:
-            if previous is None:
-                os.environ.pop(STORAGE_ENV, None)
-            else:
-                os.environ[STORAGE_ENV] = previous
-        self.assertEqual(1, result)
-        self.assertIn("source file/folder not found", buffer.getvalue())
-
-    # Path resolution tests
-    def test_normalize_path_trailing_slash(self):
-        result = normalize_path("bucket/prompt1/")
-        self.assertEqual("bucket/prompt1", result)
-
-    def test_normalize_path_empty_segments(self):
-        result = normalize_path("bucket//prompt1")
-        self.assertEqual("bucket/prompt1", result)
+        with contextlib.redirect_stdout(buffer):
+            result = main(["hello"])
+        self.assertEqual(0, result)
+        self.assertEqual("hi there\n", buffer.getvalue())
 
-    def test_normalize_path_leading_slash(self):
-        result = normalize_path("/bucket/prompt1")
-        self.assertEqual("bucket/prompt1", result)
+    def test_cli_fast_path_skips_argparse(self):
+        self._write(self.storage / "hello.md", "hi")
+        buffer = io.StringIO()
+        # A None entry makes any `import argparse` raise ImportError
+        with mock.patch.dict(sys.modules, {"argparse": None}):
+            with contextlib.redirect_stdout(buffer):
+                result = main(["hello"])
+        self.assertEqual(0, result)
+        self.assertEqual("hi\n", buffer.getvalue())
 
-    def test_normalize_path_simple(self):
-        result = normalize_path("prompt1")
-        self.assertEqual("prompt1", result)
+    def test_cli_dispatches_save_and_rm(self):
+        source = self._source("cli.md", "via cli")
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            with contextlib.redirect_stderr(self._err_buf):
+                saved = main(["save", str(source)])
+                removed = main(["rm", "cli"])
+                missing = main(["add", str(self.workspace / "nope.md")])
+        self.assertEqual((0, 0, 1), (saved, removed, missing))
+        self.assertEqual(
+            "Saved entry as cli.md\nRemoved entry cli\n", buffer.getvalue()
+        )
+        self.assertIn(_ERR_SRC_NOT_FOUND, self._err_buf.getvalue())
 
-    def test_resolve_path_flat(self):
-        result = resolve_path("prompt1", self.storage)
-        expected = self.storage / "prompt1.md"
-        self.assertEqual(expected, result)
+    def test_cli_watch_unsupported_platform_skips_banner(self):
+        buffer = io.StringIO()
+        with mock.patch("promptpaste._IS_LINUX", False):
+            with contextlib.redirect_stdout(buffer):
+                with contextlib.redirect_stderr(self._err_buf):
+                    result = main(["watch"])
+        self.assertEqual(1, result)
+        self.assertEqual("", buffer.getvalue())
+        self.assertIn("requires Linux", self._err_buf.getvalue())
 
-    def test_resolve_path_hierarchical(self):
-        result = resolve_path("bucket/prompt1", self.storage)
-        expected = self.storage / "bucket" / "prompt1.md"
-        self.assertEqual(expected, result)
+    def test_cli_complete_lists_entry_ids(self):
+        self._write(self.storage / "alpha.md", "a")
+        self._write(self.storage / "beta.txt", "b")
+        (self.storage / "bucket").mkdir()
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            result = main(["__complete"])
+        self.assertEqual(0, result)
+        self.assertEqual("alpha\nbeta\n", buffer.getvalue())
 
-    def test_resolve_path_deep_hierarchy(self):
-        result = resolve_path("folder/subfolder/file", self.storage)
-        expected = self.storage / "folder" / "subfolder" / "file.md"
-        self.assertEqual(expected, result)
+    def test_storage_dir_follows_env_override(self):
+        os.environ[STORAGE_ENV] = str(self.storage / "first")
+        first = ensure_storage_dir()
+        os.environ[STORAGE_ENV] = str(self.storage / "second")
+        second = ensure_storage_dir()
+        self.assertEqual(self.storage / "first", first)
+        self.assertEqual(self.storage / "second", second)
+        self.assertTrue(second.is_dir())
 
-    def test_resolve_path_with_extension(self):
-        result = resolve_path("bucket/prompt1.md", self.storage)
-        expected = self.storage / "bucket" / "prompt1.md"
-        self.assertEqual(expected, result)
+    def test_save_missing_error(self):
+        with contextlib.redirect_stderr(self._err_buf):
+            result = main(["save", "missing.txt"])
+        self.assertEqual(1, result)
+        self.assertIn(_ERR_SRC_NOT_FOUND, self._err_buf.getvalue())
 
+    # Path resolution tests
     def test_get_entry_by_path_flat(self):
-        (self.storage / "prompt1.md").write_text("content")
+        self._write(self.storage / "prompt1.md", "content")
         result = get_entry_by_path("prompt1", self.storage)
         expected = self.storage / "prompt1.md"
         self.assertEqual(expected, result)
 
     def test_get_entry_by_path_hierarchical(self):
-        (self.storage / "bucket").mkdir()
-        (self.storage / "bucket" / "prompt1.md").write_text("content")
+        bucket = self.storage / "bucket"
+        bucket.mkdir()
+        expected = bucket / "prompt1.md"
+        self._write(expected, "content")
         result = get_entry_by_path("bucket/prompt1", self.storage)
-        expected = self.storage / "bucket" / "prompt1.md"
         self.assertEqual(expected, result)
 
     def test_get_entry_by_path_not_found(self):
         with self.assertRaises(FileNotFoundError):
             get_entry_by_path("missing", self.storage)
 
+    def test_get_entry_by_path_sees_saved_entry_after_miss(self):
+        with self.assertRaises(FileNotFoundError):
+            get_entry_by_path("late", self.storage)
+        save_entry(self._source("late.md", "later"), storage=self.storage)
+        result = get_entry_by_path("late", self.storage)
+        self.assertEqual(self.storage / "late.md", result)
+
+    def test_read_entry_follows_rename_outside_pp(self):
+        self._write(self.storage / "n.md", "note")
+        self.assertEqual("note", read_entry("n", storage=self.storage))
+        os.rename(self.storage / "n.md", self.storage / "n.txt")
+        self.assertEqual("note", read_entry("n", storage=self.storage))
+
+    def test_read_entry_sees_external_create_after_miss(self):
+        with self.assertRaises(FileNotFoundError):
+            read_entry("bucket/p1", storage=self.storage)
+        (self.storage / "bucket").mkdir()
+        self._write(self.storage / "bucket" / "p1.md", "made outside pp")
+        self.assertEqual("made outside pp", read_entry("bucket/p1", self.storage))
+
+    def test_get_entry_by_path_sees_imported_entry_after_miss(self):
+        with self.assertRaises(FileNotFoundError):
+            get_entry_by_path("test_folder/file1", self.storage)
+        import_folder(self._template_folder(), self.storage, self._prompt(["y"]))
+        result = get_entry_by_path("test_folder/file1", self.storage)
+        self.assertEqual(self.storage / "test_folder" / "file1.md", result)
+
     def test_get_entry_by_path_partial_match(self):
         (self.storage / "bucket").mkdir()
-        (self.storage / "bucket" / "prompt1.md").write_text("content")
+        self._write(self.storage / "bucket" / "prompt1.md", "content")
         with self.assertRaises(FileNotFoundError):
             get_entry_by_path("bucket", self.storage)
 
     # Folder discovery tests
-    def test_is_eligible_file_md(self):
-        result = is_eligible_file(Path("file.md"))
-        self.assertTrue(result)
-
-    def test_is_eligible_file_txt(self):
-        result = is_eligible_file(Path("file.txt"))
-        self.assertTrue(result)
-
-    def test_is_eligible_file_other(self):
-        result = is_eligible_file(Path("file.py"))
-        self.assertFalse(result)
-
     def test_discover_folder_files_basic(self):
         test_folder = self.workspace / "test_folder"
-        test_folder.mkdir()
-        (test_folder / "file1.md").write_text("content1")
-        (test_folder / "file2.txt").write_text("content2")
-        (test_folder / "file3.py").write_text("content3")
+        self._tree(
+            {"file1.md": "content1", "file2.txt": "content2", "file3.py": "content3"},
+            test_folder,
+        )
 
         result = discover_folder_files(test_folder)
         self.assertEqual(2, len(result))
@@ -204,10 +524,7 @@ class PromptPasteTests(unittest.TestCase):
 
     def test_discover_folder_files_with_subfolders(self):
         test_folder = self.workspace / "test_folder"
-        test_folder.mkdir()
-        subfolder = test_folder / "subfolder"
-        subfolder.mkdir()
-        (subfolder / "file.md").write_text("content")
+        self._tree({"subfolder/file.md": "content"}, test_folder)
 
         result = discover_folder_files(test_folder)
         self.assertEqual(1, len(result))
@@ -227,25 +544,62 @@ class PromptPasteTests(unittest.TestCase):
 
     def test_discover_folder_files_not_directory(self):
         test_file = self.workspace / "test_file.txt"
-        test_file.write_text("content")
+        self._write(test_file, "content")
 
         with self.assertRaises(NotADirectoryError):
             discover_folder_files(test_file)
 
     def test_discover_folder_files_skips_prohibited(self):
         test_folder = self.workspace / "test_folder"
-        test_folder.mkdir()
-        (test_folder / "list.md").write_text("content")
-        (test_folder / "valid.md").write_text("content")
+        self._tree({"list.md": "content", "valid.md": "content"}, test_folder)
 
         result = discover_folder_files(test_folder)
         self.assertEqual(1, len(result))
         self.assertIn(Path("valid.md"), result)
 
+    def test_discover_folder_files_skips_dangling_symlinks(self):
+        test_folder = self.workspace / "test_folder"
+        self._tree({"valid.md": "content"}, test_folder)
+        try:
+            os.symlink(self.workspace / "gone.md", test_folder / "foo.md")
+        except (OSError, NotImplementedError):
+            self.skipTest("symlinks unavailable")
+
+        self.assertEqual([Path("valid.md")], discover_folder_files(test_folder))
+        result = import_folder(test_folder, self.storage, self._prompt(["y"]))
+        self.assertEqual(["valid.md"], list(result))
+
+    def test_discover_folder_files_skips_hidden_and_tooling_dirs(self):
+        test_folder = self.workspace / "test_folder"
+        self._tree(
+            {
+                f"{sub}/notes.md": "content"
+                for sub in (".git", "node_modules", "__pycache__", "docs")
+            },
+            test_folder,
+        )
+
+        result = discover_folder_files(test_folder)
+        self.assertEqual([Path("docs/notes.md")], result)
+
+    def test_discover_folder_files_lists_each_folder_once(self):
+        test_folder = self.workspace / "test_folder"
+        self._tree(
+            {f"d{d}/note{i}.md": "content" for d in range(5) for i in range(200)},
+            test_folder,
+        )
+
+        with mock.patch.object(os, "scandir", wraps=os.scandir) as scandir:
+            result = discover_folder_files(test_folder)
+
+        self.assertEqual(1000, len(result))
+        # One directory listing per folder (root + 5), never one per file
+        self.assertLessEqual(scandir.call_count, 6)
+
     def test_get_folder_structure_basic(self):
         test_folder = self.workspace / "test_folder"
         test_folder.mkdir()
-        (test_folder / "file.md").write_text("content")
+        self._write(test_folder / "file.md", "content")
         subfolder = test_folder / "subfolder"
         subfolder.mkdir()
 
@@ -283,36 +637,30 @@ class PromptPasteTests(unittest.TestCase):
         result = copy_file_with_collision_handling(source, dest, prompt)
         self.assertEqual(dest, result)
         self.assertTrue(dest.exists())
-        self.assertEqual("content", dest.read_text())
+        self.assertEqual("content", dest.read_bytes().decode())
 
     def test_copy_file_with_collision_handling_cancelled(self):
         source = self._source("source.md", "new content")
         dest = self.storage / "dest.md"
-        dest.write_text("old content")
+        self._write(dest, "old content")
         prompt = self._prompt(["n"])
         result = copy_file_with_collision_handling(source, dest, prompt)
         self.assertIsNone(result)
-        self.assertEqual("old content", dest.read_text())
+        self.assertEqual("old content", dest.read_bytes().decode())
 
     def test_import_folder_basic(self):
-        test_folder = self.workspace / "test_folder"
-        test_folder.mkdir()
-        (test_folder / "file1.md").write_text("content1")
-        (test_folder / "file2.txt").write_text("content2")
+        test_folder = self._template_folder()
 
         prompt = self._prompt(["y"])
         result = import_folder(test_folder, self.storage, prompt)
 
         self.assertEqual(2, len(result))
-        self.assertTrue((self.storage / "test_folder" / "file1.md").exists())
-        self.assertTrue((self.storage / "test_folder" / "file2.txt").exists())
+        dest = self.storage / "test_folder"
+        self.assertEqual({"file1.md", "file2.txt"}, self._names(dest))
 
     def test_import_folder_with_subfolders(self):
         test_folder = self.workspace / "test_folder"
-        test_folder.mkdir()
-        subfolder = test_folder / "subfolder"
-        subfolder.mkdir()
-        (subfolder / "file.md").write_text("content")
+        self._tree({"subfolder/file.md": "content"}, test_folder)
 
         prompt = self._prompt(["y"])
         result = import_folder(test_folder, self.storage, prompt)
@@ -324,8 +672,7 @@ class PromptPasteTests(unittest.TestCase):
 
     def test_import_folder_cancelled(self):
         test_folder = self.workspace / "test_folder"
-        test_folder.mkdir()
-        (test_folder / "file.md").write_text("content")
+        self._tree({"file.md": "content"}, test_folder)
 
         prompt = self._prompt(["n"])
         result = import_folder(test_folder, self.storage, prompt)
@@ -335,61 +682,71 @@ class PromptPasteTests(unittest.TestCase):
 
     def test_import_folder_auto_rename(self):
         test_folder = self.workspace / "test_folder"
-        test_folder.mkdir()
-        (test_folder / "file.md").write_text("new content")
+        self._tree({"file.md": "new content"}, test_folder)
 
         # Create existing file in storage
-        (self.storage / "test_folder").mkdir()
-        (self.storage / "test_folder" / "file.md").write_text("old content")
+        self._tree({"test_folder/file.md": "old content"}, self.storage)
 
         prompt = self._prompt(["y", "r"])
         result = import_folder(test_folder, self.storage, prompt, auto_rename=False)
 
         self.assertEqual(1, len(result))
-        self.assertTrue((self.storage / "test_folder" / "file_2.md").exists())
-        self.assertEqual(
-            "new content", (self.storage / "test_folder" / "file_2.md").read_text()
-        )
+        renamed = self.storage / "test_folder" / "file_2.md"
+        self.assertTrue(renamed.exists())
+        self.assertEqual("new content", renamed.read_bytes().decode())
 
     def test_import_folder_overwrite(self):
         test_folder = self.workspace / "test_folder"
-        test_folder.mkdir()
-        (test_folder / "file.md").write_text("new content")
+        self._tree({"file.md": "new content"}, test_folder)
 
         # Create existing file in storage
-        (self.storage / "test_folder").mkdir()
-        (self.storage / "test_folder" / "file.md").write_text("old content")
+        self._tree({"test_folder/file.md": "old content"}, self.storage)
 
         prompt = self._prompt(["y"])
         result = import_folder(test_folder, self.storage, prompt, overwrite=True)
 
         self.assertEqual(1, len(result))
-        self.assertTrue((self.storage / "test_folder" / "file.md").exists())
+        overwritten = self.storage / "test_folder" / "file.md"
+        self.assertEqual({"file.md"}, self._names(overwritten.parent))
+        self.assertEqual("new content", overwritten.read_bytes().decode())
+
+    def test_import_folder_many_files(self):
+        test_folder = self.workspace / "test_folder"
+        spec = {f"note{i}.md": f"top {i}" for i in range(10)}
+        spec.update({f"nested/note{i}.txt": f"nested {i}" for i in range(10)})
+        self._tree(spec, test_folder)
+        self._tree({"test_folder/note3.md": "old"}, self.storage)
+
+        prompt = self._prompt(["y"])
+        result = import_folder(test_folder, self.storage, prompt, auto_rename=True)
+
+        self.assertEqual(20, len(result))
+        dest = self.storage / "test_folder"
+        self.assertEqual("old", (dest / "note3.md").read_bytes().decode())
+        self.assertEqual("top 3", (dest / "note3_2.md").read_bytes().decode())
         self.assertEqual(
-            "new content", (self.storage / "test_folder" / "file.md").read_text()
+            "nested 9", (dest / "nested" / "note9.txt").read_bytes().decode()
         )
 
     def test_import_folder_skips_prohibited(self):
         test_folder = self.workspace / "test_folder"
-        test_folder.mkdir()
-        (test_folder / "list.md").write_text("content1")
-        (test_folder / "valid.md").write_text("content2")
+        self._tree({"list.md": "content1", "valid.md": "content2"}, test_folder)
 
         prompt = self._prompt(["y"])
         result = import_folder(test_folder, self.storage, prompt)
 
         self.assertEqual(1, len(result))
-        self.assertFalse((self.storage / "test_folder" / "list.md").exists())
-        self.assertTrue((self.storage / "test_folder" / "valid.md").exists())
+        dest = self.storage / "test_folder"
+        self.assertEqual({"valid.md"}, self._names(dest))
 
     # Folder merge tests
     def test_detect_conflicts_basic(self):
         source = self.workspace / "source"
         target = self.workspace / "target"
-        source.mkdir()
-        target.mkdir()
-        (source / "file1.md").write_text("source content")
-        (target / "file1.md").write_text("target content")
+        self._tree(
+            {"source/file1.md": "source content", "target/file1.md": "target content"},
+            self.workspace,
+        )
 
         conflicts = detect_conflicts(source, target)
         self.assertEqual([Path("file1.md")], conflicts)
@@ -397,14 +754,13 @@ class PromptPasteTests(unittest.TestCase):
     def test_detect_conflicts_nested(self):
         source = self.workspace / "source"
         target = self.workspace / "target"
-        source.mkdir()
-        target.mkdir()
-        source_sub = source / "subfolder"
-        target_sub = target / "subfolder"
-        source_sub.mkdir()
-        target_sub.mkdir()
-        (source_sub / "file.md").write_text("source content")
-        (target_sub / "file.md").write_text("target content")
+        self._tree(
+            {
+                "source/subfolder/file.md": "source content",
+                "target/subfolder/file.md": "target content",
+            },
+            self.workspace,
+        )
 
         conflicts = detect_conflicts(source, target)
         self.assertEqual([Path("subfolder/file.md")], conflicts)
@@ -412,26 +768,56 @@ class PromptPasteTests(unittest.TestCase):
     def test_detect_conflicts_no_conflicts(self):
         source = self.workspace / "source"
         target = self.workspace / "target"
-        source.mkdir()
-        target.mkdir()
-        (source / "file1.md").write_text("source content")
-        (target / "file2.md").write_text("target content")
+        self._tree(
+            {"source/file1.md": "source content", "target/file2.md": "target content"},
+            self.workspace,
+        )
 
         conflicts = detect_conflicts(source, target)
         self.assertEqual([], conflicts)
 
+    def test_detect_conflicts_from_list(self):
+        target = self.workspace / "target"
+        self._tree({"file1.md": "target content"}, target)
+
+        files = [Path("file1.md"), Path("file2.md")]
+        conflicts = detect_conflicts_from_list(files, target)
+        self.assertEqual([Path("file1.md")], conflicts)
+
     def test_resolve_conflict_with_prepend(self):
         source = self._source("source.md", "new content")
         target = self.storage / "target.md"
-        target.write_text("old content")
+        self._write(target, "old content")
 
         resolve_conflict_with_prepend(source, target)
-        result = target.read_text()
+        result = target.read_bytes().decode()
 
         self.assertIn("new content", result)
         self.assertIn("old content", result)
         self.assertIn("--- MERGED ---", result)
 
+    def test_resolve_conflict_with_prepend_keeps_bytes(self):
+        source = self.workspace / "source.md"
+        source.write_bytes(b"new\xff")
+        target = self.storage / "target.md"
+        target.write_bytes(b"old")
+
+        resolve_conflict_with_prepend(source, target)
+
+        self.assertEqual(b"new\xff\n\n--- MERGED ---\n\nold", target.read_bytes())
+        self.assertEqual(["target.md"], os.listdir(self.storage))
+
+    def test_resolve_conflict_with_prepend_stacks_merges(self):
+        separator = b"\n\n--- MERGED ---\n\n"
+        source = self._source("source.md", "newest")
+        target = self.storage / "target.md"
+        self._writev(target, [b"older", separator, b"oldest"])
+
+        resolve_conflict_with_prepend(source, target)
+
+        expected = b"newest" + separator + b"older" + separator + b"oldest"
+        self.assertEqual(expected, target.read_bytes())
+
     def test_confirm_merge_yes(self):
         target = self.storage / "target"
         target.mkdir()
@@ -449,102 +835,96 @@ class PromptPasteTests(unittest.TestCase):
     def test_merge_folders_basic(self):
         source = self.workspace / "source"
         target = self.workspace / "target"
-        source.mkdir()
+        self._tree({"file1.md": "source content"}, source)
         target.mkdir()
-        (source / "file1.md").write_text("source content")
 
         prompt = self._prompt(["y"])
         result = merge_folders(source, target, prompt)
 
         self.assertEqual(1, len(result["merged"]))
-        self.assertTrue((target / "file1.md").exists())
-        self.assertEqual("source content", (target / "file1.md").read_text())
+        self.assertEqual({"file1.md"}, self._names(target))
+        self.assertEqual("source content", (target / "file1.md").read_bytes().decode())
 
     def test_merge_folders_with_conflicts(self):
         source = self.workspace / "source"
         target = self.workspace / "target"
-        source.mkdir()
-        target.mkdir()
-        (source / "file1.md").write_text("new content")
-        (target / "file1.md").write_text("old content")
+        self._tree(
+            {"source/file1.md": "new content", "target/file1.md": "old content"},
+            self.workspace,
+        )
 
         prompt = self._prompt(["y"])
         result = merge_folders(source, target, prompt)
 
         self.assertEqual(1, len(result["conflicts"]))
-        merged_content = (target / "file1.md").read_text()
+        self.assertEqual({"file1.md"}, self._names(target))
+        merged_content = (target / "file1.md").read_bytes().decode()
         self.assertIn("new content", merged_content)
         self.assertIn("old content", merged_content)
 
     def test_merge_folders_cancelled(self):
         source = self.workspace / "source"
         target = self.workspace / "target"
-        source.mkdir()
+        self._tree({"file1.md": "source content"}, source)
         target.mkdir()
-        (source / "file1.md").write_text("source content")
 
         prompt = self._prompt(["n"])
         result = merge_folders(source, target, prompt)
 
         self.assertEqual(0, len(result["merged"]))
-        self.assertFalse((target / "file1.md").exists())
+        self.assertEqual(set(), self._names(target))
 
     def test_merge_folders_nested_structure(self):
         source = self.workspace / "source"
         target = self.workspace / "target"
-        source.mkdir()
+        self._tree({"subfolder/file.md": "source content"}, source)
         target.mkdir()
-        source_sub = source / "subfolder"
-        source_sub.mkdir()
-        (source_sub / "file.md").write_text("source content")
 
         prompt = self._prompt(["y"])
         result = merge_folders(source, target, prompt)
 
         self.assertEqual(1, len(result["merged"]))
-        self.assertTrue((target / "subfolder" / "file.md").exists())
+        self.assertEqual({"file.md"}, self._names(target / "subfolder"))
 
     # CLI integration tests
     def test_cli_add_folder(self):
-        test_folder = self.workspace / "test_folder"
-        test_folder.mkdir()
-        (test_folder / "file1.md").write_text("content1")
-        (test_folder / "file2.txt").write_text("content2")
+        test_folder = self._template_folder()
 
         prompt = self._prompt(["y"])
         result = save_entry(test_folder, storage=self.storage, prompt_fn=prompt)
 
         self.assertIsNotNone(result)
-        self.assertTrue((self.storage / "test_folder" / "file1.md").exists())
-        self.assertTrue((self.storage / "test_folder" / "file2.txt").exists())
+        dest = self.storage / "test_folder"
+        self.assertEqual({"file1.md", "file2.txt"}, self._names(dest))
 
     def test_cli_add_folder_with_merge(self):
         test_folder = self.workspace / "test_folder"
         test_folder.mkdir()
-        (test_folder / "file1.md").write_text("new content")
+        self._write(test_folder / "file1.md", "new content")
 
         # Create existing folder in storage
         (self.storage / "test_folder").mkdir()
-        (self.storage / "test_folder" / "file1.md").write_text("old content")
+        merged_file = self.storage / "test_folder" / "file1.md"
+        self._write(merged_file, "old content")
 
         prompt = self._prompt(["y"])
         result = save_entry(test_folder, storage=self.storage, prompt_fn=prompt)
 
         self.assertIsNotNone(result)
-        merged_content = (self.storage / "test_folder" / "file1.md").read_text()
+        merged_content = merged_file.read_bytes().decode()
         self.assertIn("new content", merged_content)
         self.assertIn("old content", merged_content)
 
     def test_cli_retrieve_hierarchical_path(self):
         # Create folder structure
         (self.storage / "bucket").mkdir()
-        (self.storage / "bucket" / "prompt1.md").write_text("bucket content")
+        self._write(self.storage / "bucket" / "prompt1.md", "bucket content")
 
         content = read_entry("bucket/prompt1", storage=self.storage)
         self.assertEqual("bucket content", content)
 
     def test_cli_retrieve_flat_path(self):
-        (self.storage / "prompt1.md").write_text("flat content")
+        self._write(self.storage / "prompt1.md", "flat content")
 
         content = read_entry("prompt1", storage=self.storage)
         self.assertEqual("flat content", content)
@@ -552,7 +932,7 @@ class PromptPasteTests(unittest.TestCase):
     def test_cli_add_folder_cancelled(self):
         test_folder = self.workspace / "test_folder"
         test_folder.mkdir()
-        (test_folder / "file.md").write_text("content")
+        self._write(test_folder / "file.md", "content")
 
         prompt = self._prompt(["n"])
         result = save_entry(test_folder, storage=self.storage, prompt_fn=prompt)
@@ -564,36 +944,43 @@ class PromptPasteTests(unittest.TestCase):
     def test_is_single_skill_folder_true(self):
         skill_folder = self.workspace / "my-skill"
         skill_folder.mkdir()
-        (skill_folder / "SKILL.md").write_text("# My Skill")
+        self._write(skill_folder / "SKILL.md", "# My Skill")
 
         self.assertTrue(is_single_skill_folder(skill_folder))
 
     def test_is_single_skill_folder_false_multiple_files(self):
         skill_folder = self.workspace / "my-skill"
         skill_folder.mkdir()
-        (skill_folder / "SKILL.md").write_text("# My Skill")
-        (skill_folder / "COMMANDS.md").write_text("# Commands")
+        self._write(skill_folder / "SKILL.md", "# My Skill")
+        self._write(skill_folder / "COMMANDS.md", "# Commands")
 
         self.assertFalse(is_single_skill_folder(skill_folder))
 
+    def test_is_single_skill_folder_ignores_subfolders(self):
+        skill_folder = self.workspace / "my-skill"
+        (skill_folder / "assets").mkdir(parents=True)
+        self._write(skill_folder / "SKILL.md", "# My Skill")
+
+        self.assertTrue(is_single_skill_folder(skill_folder))
+
     def test_is_single_skill_folder_false_wrong_name(self):
         skill_folder = self.workspace / "my-skill"
         skill_folder.mkdir()
-        (skill_folder / "skill.md").write_text("# My Skill")  # lowercase
+        self._write(skill_folder / "skill.md", "# My Skill")  # lowercase
 
         self.assertFalse(is_single_skill_folder(skill_folder))
 
     def test_is_single_skill_folder_false_not_directory(self):
         skill_file = self.workspace / "my-skill.md"
-        skill_file.write_text("# My Skill")
+        self._write(skill_file, "# My Skill")
 
         self.assertFalse(is_single_skill_folder(skill_file))
 
     def test_save_single_skill_folder_imports_as_file(self):
         skill_folder = self.workspace / "my-awesome-skill"
         skill_folder.mkdir()
-        (skill_folder / "SKILL.md").write_text(
-            "# My Awesome Skill\n\nThis is the content."
+        self._write(
+            skill_folder / "SKILL.md", "# My Awesome Skill\n\nThis is the content."
         )
 
         result = save_entry(
@@ -605,14 +992,14 @@ class PromptPasteTests(unittest.TestCase):
         saved_file = self.storage / "my-awesome-skill.md"
         self.assertTrue(saved_file.exists())
         self.assertTrue(saved_file.is_file())
-        content = saved_file.read_text()
+        content = saved_file.read_bytes().decode()
         self.assertIn("My Awesome Skill", content)
 
     def test_save_skill_folder_with_extra_files_imports_as_folder(self):
         skill_folder = self.workspace / "multi-file-skill"
         skill_folder.mkdir()
-        (skill_folder / "SKILL.md").write_text("# Multi File Skill")
-        (skill_folder / "COMMANDS.md").write_text("# Commands")
+        self._write(skill_folder / "SKILL.md", "# Multi File Skill")
+        self._write(skill_folder / "COMMANDS.md", "# Commands")
 
         result = save_entry(
             skill_folder, storage=self.storage, prompt_fn=self._prompt(["y"])
@@ -620,9 +1007,55 @@ class PromptPasteTests(unittest.TestCase):
 
         self.assertIsNotNone(result)
         # Should be saved as a folder
-        self.assertTrue((self.storage / "multi-file-skill").is_dir())
-        self.assertTrue((self.storage / "multi-file-skill" / "SKILL.md").exists())
-        self.assertTrue((self.storage / "multi-file-skill" / "COMMANDS.md").exists())
+        dest = self.storage / "multi-file-skill"
+        self.assertEqual({"SKILL.md", "COMMANDS.md"}, self._names(dest))
+
+
+class PurePathTests(unittest.TestCase):
+    """Checks for pure helpers; no filesystem fixture needed."""
+
+    def test_normalize_path_table(self):
+        cases = [
+            ("bucket/prompt1/", "bucket/prompt1"),
+            ("bucket//prompt1", "bucket/prompt1"),
+            ("/bucket/prompt1", "bucket/prompt1"),
+            ("//bucket///prompt1//", "bucket/prompt1"),
+            ("prompt1", "prompt1"),
+        ]
+        for path_str, expected in cases:
+            with self.subTest(path_str=path_str):
+                self.assertEqual(expected, normalize_path(path_str))
+
+    def test_resolve_path_table(self):
+        cases = [
+            ("prompt1", ("prompt1.md",)),
+            ("bucket/prompt1", ("bucket", "prompt1.md")),
+            ("folder/subfolder/file", ("folder", "subfolder", "file.md")),
+            ("bucket/prompt1.md", ("bucket", "prompt1.md")),
+        ]
+        storage = Path("/storage")
+        for path_str, parts in cases:
+            with self.subTest(path_str=path_str):
+                expected = storage.joinpath(*parts)
+                self.assertEqual(expected, resolve_path(path_str, storage))
+
+    def test_is_eligible_file_md(self):
+        result = is_eligible_file(Path("file.md"))
+        self.assertTrue(result)
+
+    def test_is_eligible_file_txt(self):
+        result = is_eligible_file(Path("file.txt"))
+        self.assertTrue(result)
+
+    def test_is_eligible_file_other(self):
+        result = is_eligible_file(Path("file.py"))
+        self.assertFalse(result)
+
+    def test_inotify_events_decodes_buffer(self):
+        data = struct.pack("iIII", 1, 0x100, 0, 8) + b"a.md\0\0\0\0"
+        data += struct.pack("iIII", 2, 0x8000, 0, 0)
+        events = list(_inotify_events(data))
+        self.assertEqual([(1, 0x100, "a.md"), (2, 0x8000, "")], events)
 
 
 if __name__ == "__main__":